@@ -5,13 +5,31 @@ Scrapes episode ratings from IMDB and generates a GitHub-style heatmap visualiza
 """
 
 import argparse
+import functools
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
 
+import lxml.etree
+import lxml.html
+import numpy as np
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from jinja2 import Environment, FileSystemLoader
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
 
 # Constants
 HEADERS = {
@@ -21,21 +39,141 @@ HEADERS = {
 OUTPUT_DIR = Path(__file__).parent / "output"
 TEMPLATES_DIR = Path(__file__).parent / "templates"
 
+# Retry transient failures with backoff instead of letting one bad response sink the scrape
+_RETRY = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504], allowed_methods=["GET"])
+
+# Pre-compiled regexes
+_RE_JSONLD_SCRIPT = re.compile(rb'<script[^>]+application/ld\+json[^>]*>(.*?)</script>', re.DOTALL)
+_RE_IMDB_ID = re.compile(r"tt\d+")
+_RE_SEASON_QS = re.compile(r'season=(\d+)')
+_RE_EP_HEADER = re.compile(r'[ES]\d+\.?(?:E(?P<ep>\d*)|S?\d*)\s*[∙·]\s*(?P<title>.+)')
+_RE_RATING = re.compile(r'(\d+\.?\d*)')
+_RE_EP_NUM = re.compile(r'E(\d+)')
+_RE_SLUG_NONWORD = re.compile(r'[^\w\s-]')
+_RE_SLUG_DASH = re.compile(r'[-\s]+')
+
+# Parse-time filters so BeautifulSoup only builds the parts of the page we read
+_JSONLD_STRAINER = SoupStrainer("script", attrs={"type": "application/ld+json"})
+_SEASON_LINKS_STRAINER = SoupStrainer("a", href=_RE_SEASON_QS)
+
+# Pre-compiled XPaths for the show page and episode HTML fallback; each tuple is in priority order
+_JSONLD_SCRIPT_XPATH = lxml.etree.XPath('//script[@type="application/ld+json"]')
+_SHOW_TITLE_XPATHS = (
+    lxml.etree.XPath('//h1[@data-testid="hero__pageTitle"]//span'),
+    lxml.etree.XPath('//h1'),
+)
+_SHOW_POSTER_XPATHS = (
+    lxml.etree.XPath('//img[contains(concat(" ", normalize-space(@class), " "), " ipc-image ")][@srcset]'),
+    lxml.etree.XPath('//div[@data-testid="hero-media__poster"]//img'),
+)
+_EPISODE_ITEM_XPATHS = (
+    lxml.etree.XPath('//article[contains(concat(" ", normalize-space(@class), " "), " episode-item-wrapper ")]'),
+    lxml.etree.XPath('//div[contains(concat(" ", normalize-space(@class), " "), " list_item ")]'),
+    lxml.etree.XPath('//*[@data-testid="episodes-container"]/div'),
+)
+_EPISODE_TITLE_XPATHS = (
+    lxml.etree.XPath('.//a[@data-testid="episode-title-link"]'),
+    lxml.etree.XPath('.//a[@itemprop="name"]'),
+    lxml.etree.XPath('.//strong//a'),
+    lxml.etree.XPath('.//a[contains(@href, "/title/tt")]'),
+)
+_EPISODE_TITLE_DIV_XPATH = lxml.etree.XPath('.//div[contains(concat(" ", normalize-space(@class), " "), " ipc-title__text ")]')
+_EPISODE_RATING_XPATHS = (
+    lxml.etree.XPath('.//span[contains(concat(" ", normalize-space(@class), " "), " ipc-rating-star--rating ")]'),
+    lxml.etree.XPath('.//span[contains(concat(" ", normalize-space(@class), " "), " ipc-rating-star ")]'),
+    lxml.etree.XPath('.//*[contains(concat(" ", normalize-space(@class), " "), " ratingValue ")]//span'),
+    lxml.etree.XPath('.//*[@data-testid="ratingGroup--imdb-rating"]'),
+)
+
+# Rating color buckets: lower bounds of each band, colors low -> high, gray last for no rating
+_RATING_COLOR_BOUNDS = np.array([4, 5, 6, 7, 8, 9], dtype=np.float64)
+_RATING_COLORS = np.array(["#da3633", "#f85149", "#d29922", "#e3b341", "#7ee787", "#3fb950", "#238636", "#3d3d3d"])
+
+# Color per integer rating 0-10 (derived from the bands above), so get_rating_color needs no comparison ladder
+_COLOR_TABLE = tuple(_RATING_COLORS[np.searchsorted(_RATING_COLOR_BOUNDS, np.arange(11), side="right")].tolist())
+_NO_RATING_COLOR = str(_RATING_COLORS[-1])
+
 
 def extract_json_ld(soup: BeautifulSoup) -> dict | None:
     """Extract JSON-LD structured data from page."""
     script_tag = soup.find("script", type="application/ld+json")
-    if script_tag and script_tag.string:
-        try:
-            return json.loads(script_tag.string)
-        except json.JSONDecodeError:
-            return None
-    return None
+    if not script_tag:
+        return None
+    try:
+        # The JSON-LD script is a single text node; read it directly rather than via .string
+        return json_loads(str(script_tag.contents[0]))
+    except (IndexError, TypeError, json.JSONDecodeError):
+        return None
+
+
+def _extract_jsonld_fast(html: bytes) -> dict | None:
+    """Extract JSON-LD structured data from raw page bytes without building a DOM."""
+    match = _RE_JSONLD_SCRIPT.search(html)
+    if not match:
+        return None
+    try:
+        return json_loads(match.group(1))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _session() -> requests.Session:
+    """Build the shared session on first use so every fetch reuses one keep-alive connection.
+
+    Backed by an on-disk HTTP cache when requests-cache is installed; created lazily so
+    importing the module never touches the filesystem.
+    """
+    if requests_cache is not None:
+        session = requests_cache.CachedSession(OUTPUT_DIR / ".http_cache", backend="sqlite", expire_after=3600)
+    else:
+        session = requests.Session()
+    session.headers.update(HEADERS)
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=_RETRY))
+    return session
+
+
+def _fetch_page(url: str) -> bytes:
+    """Fetch an IMDB page and return its raw body bytes (never decoded to str)."""
+    response = _session().get(url, timeout=(5, 30), stream=False)
+    response.raise_for_status()
+    return response.content
+
+
+def _parse_html_tree(html: bytes) -> lxml.html.HtmlElement | None:
+    """Parse raw page bytes into an lxml tree, or None if the page has no elements.
+
+    IMDB serves UTF-8, but lxml assumes latin-1 for bytes without a meta charset.
+    A fresh parser is used per call since lxml parsers aren't thread-safe.
+    """
+    try:
+        return lxml.html.fromstring(html, parser=lxml.html.HTMLParser(encoding="utf-8"))
+    except lxml.etree.ParserError:
+        return None
+
+
+def _load_json_ld(html: bytes) -> dict | None:
+    """Extract JSON-LD from raw page bytes, falling back to a strained BeautifulSoup parse."""
+    json_ld = _extract_jsonld_fast(html)
+    if json_ld is None:
+        json_ld = extract_json_ld(BeautifulSoup(html, "lxml", parse_only=_JSONLD_STRAINER))
+    return json_ld
+
+
+def _extract_jsonld_tree(tree: lxml.html.HtmlElement) -> dict | None:
+    """Extract JSON-LD structured data from an already-parsed lxml tree."""
+    script = _first_element(tree, (_JSONLD_SCRIPT_XPATH,))
+    if script is None or not script.text:
+        return None
+    try:
+        return json_loads(script.text)
+    except json.JSONDecodeError:
+        return None
 
 
 def get_imdb_id(url: str) -> str:
     """Extract IMDB title ID from URL."""
-    match = re.search(r"tt\d+", url)
+    match = _RE_IMDB_ID.search(url)
     if not match:
         raise ValueError(f"Could not extract IMDB ID from URL: {url}")
     return match.group()
@@ -44,13 +182,18 @@ def get_imdb_id(url: str) -> str:
 def get_show_info(imdb_id: str) -> dict:
     """Fetch show name, poster URL, and season count from IMDB."""
     url = f"https://www.imdb.com/title/{imdb_id}/"
-    response = requests.get(url, headers=HEADERS)
-    response.raise_for_status()
+    html = _fetch_page(url)
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    # Parse once; name, poster, and JSON-LD fallbacks all read the same lxml tree
+    tree = _parse_html_tree(html)
+    if tree is None:
+        # Empty page: nothing to extract, fall back to the defaults
+        return {"name": "Unknown Show", "poster_url": None, "number_of_seasons": None}
 
-    # Extract JSON-LD data
-    json_ld = extract_json_ld(soup)
+    # Extract JSON-LD data (fast path on raw bytes, tree as fallback)
+    json_ld = _extract_jsonld_fast(html)
+    if json_ld is None:
+        json_ld = _extract_jsonld_tree(tree)
 
     # Get show name and season count from JSON-LD (primary)
     name = "Unknown Show"
@@ -62,17 +205,13 @@ def get_show_info(imdb_id: str) -> dict:
 
     # Fallback for name if JSON-LD didn't have it
     if name == "Unknown Show":
-        title_elem = soup.select_one('h1[data-testid="hero__pageTitle"] span')
-        if not title_elem:
-            title_elem = soup.select_one("h1")
-        if title_elem:
-            name = title_elem.get_text(strip=True)
+        title_elem = _first_element(tree, _SHOW_TITLE_XPATHS)
+        if title_elem is not None:
+            name = _element_text(title_elem)
 
     # Get poster URL (keep existing logic)
-    poster_elem = soup.select_one('img.ipc-image[srcset]')
-    if not poster_elem:
-        poster_elem = soup.select_one('div[data-testid="hero-media__poster"] img')
-    poster_url = poster_elem.get("src") if poster_elem else None
+    poster_elem = _first_element(tree, _SHOW_POSTER_XPATHS)
+    poster_url = poster_elem.get("src") if poster_elem is not None else None
 
     return {"name": name, "poster_url": poster_url, "number_of_seasons": number_of_seasons}
 
@@ -93,27 +232,21 @@ def get_seasons(imdb_id: str, known_season_count: int | None = None) -> list[int
 
     # Fallback: fetch episodes page and try to extract season info
     url = f"https://www.imdb.com/title/{imdb_id}/episodes/"
-    response = requests.get(url, headers=HEADERS)
-    response.raise_for_status()
-
-    soup = BeautifulSoup(response.text, "html.parser")
+    html = _fetch_page(url)
 
     # Try JSON-LD on episodes page
-    json_ld = extract_json_ld(soup)
-    if json_ld:
-        if "partOfSeries" in json_ld:
-            series_data = json_ld["partOfSeries"]
-            if "numberOfSeasons" in series_data:
-                return list(range(1, series_data["numberOfSeasons"] + 1))
-        if "numberOfSeasons" in json_ld:
-            return list(range(1, json_ld["numberOfSeasons"] + 1))
+    json_ld = _load_json_ld(html)
+    seasons = _seasons_from_json_ld(json_ld) if json_ld else None
+    if seasons:
+        return seasons
 
     # Fallback: parse season links from HTML
+    soup = BeautifulSoup(html, "lxml", parse_only=_SEASON_LINKS_STRAINER)
     season_links = soup.select('a[href*="episodes?season="], a[href*="episodes/?season="]')
     if season_links:
         seasons = set()
         for link in season_links:
-            match = re.search(r'season=(\d+)', link.get("href", ""))
+            match = _RE_SEASON_QS.search(link.get("href", ""))
             if match:
                 seasons.add(int(match.group(1)))
         if seasons:
@@ -122,98 +255,104 @@ def get_seasons(imdb_id: str, known_season_count: int | None = None) -> list[int
     return [1]
 
 
+def _seasons_from_json_ld(json_ld: dict) -> list[int] | None:
+    """Get season numbers from JSON-LD data, if it lists a season count."""
+    if "partOfSeries" in json_ld:
+        series_data = json_ld["partOfSeries"]
+        if "numberOfSeasons" in series_data:
+            return list(range(1, series_data["numberOfSeasons"] + 1))
+    if "numberOfSeasons" in json_ld:
+        return list(range(1, json_ld["numberOfSeasons"] + 1))
+    return None
+
+
 def get_episode_ratings(imdb_id: str, season: int) -> list[dict]:
     """Get episode titles and ratings for a specific season using JSON-LD."""
     url = f"https://www.imdb.com/title/{imdb_id}/episodes/?season={season}"
-    response = requests.get(url, headers=HEADERS)
-    response.raise_for_status()
+    html = _fetch_page(url)
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    # Try JSON-LD first (most reliable)
+    json_ld = _load_json_ld(html)
+    episodes = _episodes_from_json_ld(json_ld) if json_ld else []
+    if episodes:
+        return episodes
+
+    # Fallback: pre-compiled XPaths over the raw lxml tree
+    tree = _parse_html_tree(html)
+    if tree is None:
+        return []
+    return _get_episode_ratings_html_fallback(tree)
+
+
+def _episodes_from_json_ld(json_ld: dict) -> list[dict]:
+    """Extract episodes from the JSON-LD episode array, sorted by episode number."""
     episodes = []
 
-    # Try JSON-LD first (most reliable)
-    json_ld = extract_json_ld(soup)
+    # Look for episode array in the JSON-LD
+    episode_list = json_ld.get("episode", [])
+    if not isinstance(episode_list, list):
+        return episodes
 
-    if json_ld:
-        # Look for episode array in the JSON-LD
-        episode_list = json_ld.get("episode", [])
-        if isinstance(episode_list, list) and episode_list:
-            for ep_data in episode_list:
-                episode_num = ep_data.get("episodeNumber", len(episodes) + 1)
-                title = ep_data.get("name", f"Episode {episode_num}")
-
-                # Extract rating from aggregateRating
-                rating = None
-                agg_rating = ep_data.get("aggregateRating", {})
-                if agg_rating:
-                    rating_val = agg_rating.get("ratingValue")
-                    if rating_val is not None:
-                        try:
-                            rating = float(rating_val)
-                        except (ValueError, TypeError):
-                            pass
-
-                episodes.append({
-                    "episode_num": int(episode_num) if episode_num else len(episodes) + 1,
-                    "title": title,
-                    "rating": rating,
-                })
-
-            if episodes:
-                return sorted(episodes, key=lambda x: x["episode_num"])
-
-    # Fallback: CSS selectors
-    return _get_episode_ratings_css_fallback(soup)
-
-
-def _get_episode_ratings_css_fallback(soup: BeautifulSoup) -> list[dict]:
-    """Fallback CSS-based extraction for when JSON-LD is unavailable."""
+    for ep_data in episode_list:
+        episode_num = ep_data.get("episodeNumber", len(episodes) + 1)
+        title = ep_data.get("name", f"Episode {episode_num}")
+
+        # Extract rating from aggregateRating
+        rating = None
+        agg_rating = ep_data.get("aggregateRating", {})
+        if agg_rating:
+            rating_val = agg_rating.get("ratingValue")
+            if rating_val is not None:
+                try:
+                    rating = float(rating_val)
+                except (ValueError, TypeError):
+                    pass
+
+        episodes.append({
+            "episode_num": int(episode_num) if episode_num else len(episodes) + 1,
+            "title": title,
+            "rating": rating,
+        })
+
+    return sorted(episodes, key=lambda x: x["episode_num"])
+
+
+def _get_episode_ratings_html_fallback(tree: lxml.html.HtmlElement) -> list[dict]:
+    """Fallback XPath-based extraction for when JSON-LD is unavailable."""
     episodes = []
 
-    # Try multiple selector patterns
-    episode_items = soup.select('article.episode-item-wrapper')
-    if not episode_items:
-        episode_items = soup.select('div.list_item')
-    if not episode_items:
-        episode_items = soup.select('[data-testid="episodes-container"] > div')
+    # Try multiple item patterns
+    episode_items = []
+    for item_xpath in _EPISODE_ITEM_XPATHS:
+        episode_items = item_xpath(tree)
+        if episode_items:
+            break
 
     for idx, item in enumerate(episode_items, 1):
+        # Parse the "S1.E1 ∙ Title" header once for both the episode number and title
+        title_div = _first_element(item, (_EPISODE_TITLE_DIV_XPATH,))
+        header_text = _element_text(title_div) if title_div is not None else ""
+        header = _RE_EP_HEADER.search(header_text)
+
         # Get episode title
-        title_elem = (
-            item.select_one('a[data-testid="episode-title-link"]') or
-            item.select_one('a[itemprop="name"]') or
-            item.select_one('strong a') or
-            item.select_one('a[href*="/title/tt"]')
-        )
-        title = title_elem.get_text(strip=True) if title_elem else None
+        title_elem = _first_element(item, _EPISODE_TITLE_XPATHS)
+        title = _element_text(title_elem) if title_elem is not None else None
 
         # Fallback: title might be in ipc-title__text div (minus episode number prefix)
-        if not title:
-            title_div = item.select_one('div.ipc-title__text')
-            if title_div:
-                title_text = title_div.get_text(strip=True)
-                # Remove "S1.E1 ∙ " prefix if present
-                match = re.search(r'[ES]\d+\.?[ES]?\d*\s*[∙·]\s*(.+)', title_text)
-                if match:
-                    title = match.group(1)
-                else:
-                    title = title_text
+        if not title and header_text:
+            # Remove "S1.E1 ∙ " prefix if present
+            title = header.group("title") if header else header_text
 
         if not title:
             title = f"Episode {idx}"
 
         # Get rating
-        rating_elem = (
-            item.select_one('span.ipc-rating-star--rating') or
-            item.select_one('span.ipc-rating-star') or
-            item.select_one('.ratingValue span') or
-            item.select_one('[data-testid="ratingGroup--imdb-rating"]')
-        )
+        rating_elem = _first_element(item, _EPISODE_RATING_XPATHS)
 
         rating = None
-        if rating_elem:
-            rating_text = rating_elem.get_text(strip=True)
-            match = re.search(r'(\d+\.?\d*)', rating_text)
+        if rating_elem is not None:
+            rating_text = _element_text(rating_elem)
+            match = _RE_RATING.search(rating_text)
             if match:
                 try:
                     rating = float(match.group(1))
@@ -222,9 +361,10 @@ def _get_episode_ratings_css_fallback(soup: BeautifulSoup) -> list[dict]:
 
         # Get episode number (look for E followed by number)
         ep_num = idx
-        ep_num_elem = item.select_one('div.ipc-title__text')
-        if ep_num_elem:
-            match = re.search(r'E(\d+)', ep_num_elem.get_text())
+        if header and header.group("ep"):
+            ep_num = int(header.group("ep"))
+        else:
+            match = _RE_EP_NUM.search(header_text)
             if match:
                 ep_num = int(match.group(1))
 
@@ -237,31 +377,32 @@ def _get_episode_ratings_css_fallback(soup: BeautifulSoup) -> list[dict]:
     return episodes
 
 
+def _first_element(node: lxml.html.HtmlElement, xpaths: tuple[lxml.etree.XPath, ...]) -> lxml.html.HtmlElement | None:
+    """Return the first element matched by the first XPath (in priority order) that matches."""
+    for xpath in xpaths:
+        found = xpath(node)
+        if found:
+            return found[0]
+    return None
+
+
+def _element_text(elem: lxml.html.HtmlElement) -> str:
+    """Get an element's text with each text node stripped, like bs4's get_text(strip=True)."""
+    return "".join(text.strip() for text in elem.itertext())
+
+
 def calculate_analytics(seasons_data: list[dict]) -> dict:
-    """Calculate min/max episodes and averages."""
-    all_episodes = []
-    season_averages = []
-
-    for season in seasons_data:
-        season_ratings = []
-        for ep in season["episodes"]:
-            if ep["rating"] is not None:
-                all_episodes.append({
-                    "season": season["season_num"],
-                    "episode": ep["episode_num"],
-                    "title": ep["title"],
-                    "rating": ep["rating"],
-                })
-                season_ratings.append(ep["rating"])
-
-        if season_ratings:
-            season_averages.append({
-                "season_num": season["season_num"],
-                "average": sum(season_ratings) / len(season_ratings),
-                "episode_count": len(season_ratings),
-            })
-
-    if not all_episodes:
+    """Calculate min/max episodes and averages with vectorized numpy reductions."""
+    # Struct-of-arrays layout: parallel rating/season arrays, episode dicts kept Python-side
+    rated_episodes = [
+        (season_pos, ep)
+        for season_pos, season in enumerate(seasons_data)
+        for ep in season["episodes"]
+        if ep["rating"] is not None
+    ]
+    total_episodes = len(rated_episodes)
+
+    if not total_episodes:
         return {
             "min_episode": None,
             "max_episode": None,
@@ -272,12 +413,25 @@ def calculate_analytics(seasons_data: list[dict]) -> dict:
             "total_episodes": 0,
         }
 
-    # Find min and max
-    min_ep = min(all_episodes, key=lambda x: x["rating"])
-    max_ep = max(all_episodes, key=lambda x: x["rating"])
+    ratings = np.fromiter((ep["rating"] for _, ep in rated_episodes), dtype=np.float64, count=total_episodes)
+    season_idx = np.fromiter((pos for pos, _ in rated_episodes), dtype=np.intp, count=total_episodes)
+
+    # Per-season sums and counts in one vectorized op each
+    season_sums = np.bincount(season_idx, weights=ratings, minlength=len(seasons_data))
+    season_counts = np.bincount(season_idx, minlength=len(seasons_data))
+    season_averages = [
+        {
+            "season_num": seasons_data[pos]["season_num"],
+            "average": float(season_sums[pos] / season_counts[pos]),
+            "episode_count": int(season_counts[pos]),
+        }
+        for pos in np.flatnonzero(season_counts)
+    ]
 
-    # Overall average
-    overall_avg = sum(ep["rating"] for ep in all_episodes) / len(all_episodes)
+    # argmin/argmax return the first occurrence on ties, like min()/max()
+    min_ep = _analytics_episode(seasons_data, rated_episodes[int(np.argmin(ratings))])
+    max_ep = _analytics_episode(seasons_data, rated_episodes[int(np.argmax(ratings))])
+    overall_avg = float(ratings.mean())
 
     # Best and worst seasons
     best_season = max(season_averages, key=lambda x: x["average"]) if season_averages else None
@@ -290,29 +444,46 @@ def calculate_analytics(seasons_data: list[dict]) -> dict:
         "season_averages": season_averages,
         "best_season": best_season,
         "worst_season": worst_season,
-        "total_episodes": len(all_episodes),
+        "total_episodes": total_episodes,
+    }
+
+
+def _analytics_episode(seasons_data: list[dict], rated_episode: tuple[int, dict]) -> dict:
+    """Build the min/max episode record for a (season position, episode) pair."""
+    season_pos, ep = rated_episode
+    return {
+        "season": seasons_data[season_pos]["season_num"],
+        "episode": ep["episode_num"],
+        "title": ep["title"],
+        "rating": ep["rating"],
     }
 
 
 def get_rating_color(rating: float | None) -> str:
     """Get color for rating value (GitHub-style gradient)."""
     if rating is None:
-        return "#3d3d3d"  # Gray for no rating
-
-    if rating < 4:
-        return "#da3633"  # Red
-    elif rating < 5:
-        return "#f85149"  # Light red
-    elif rating < 6:
-        return "#d29922"  # Orange
-    elif rating < 7:
-        return "#e3b341"  # Yellow
-    elif rating < 8:
-        return "#7ee787"  # Light green
-    elif rating < 9:
-        return "#3fb950"  # Green
-    else:
-        return "#238636"  # Dark green
+        return _NO_RATING_COLOR  # Gray for no rating
+    return _bucket_rating_color(rating)
+
+
+@functools.lru_cache(maxsize=128)
+def _bucket_rating_color(rating: float) -> str:
+    """Memoized color lookup; IMDB ratings have one decimal, so there are few distinct inputs."""
+    return _COLOR_TABLE[min(max(int(rating), 0), 10)]
+
+
+def rating_colors(ratings: np.ndarray) -> np.ndarray:
+    """Get colors for an array of ratings (NaN for no rating) in one vectorized lookup."""
+    color_idx = np.searchsorted(_RATING_COLOR_BOUNDS, ratings, side="right")
+    color_idx[np.isnan(ratings)] = len(_RATING_COLORS) - 1
+    return _RATING_COLORS[color_idx]
+
+
+def _assign_rating_colors(items: list[dict], key: str) -> None:
+    """Set a precomputed "color" on each item from its rating under `key`."""
+    ratings = np.array([np.nan if item[key] is None else item[key] for item in items], dtype=np.float64)
+    for item, color in zip(items, rating_colors(ratings).tolist()):
+        item["color"] = color
 
 
 def scrape_show(url: str) -> dict:
@@ -330,21 +501,32 @@ def scrape_show(url: str) -> dict:
     season_nums = get_seasons(imdb_id, show_info.get("number_of_seasons"))
     print(f"Found {len(season_nums)} season(s)")
 
-    # Get episodes for each season
+    # Get episodes for each season (fetched concurrently over the shared session)
+    print(f"Fetching {len(season_nums)} season(s)...")
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {
+            season_num: executor.submit(get_episode_ratings, imdb_id, season_num)
+            for season_num in season_nums
+        }
+        episodes_by_season = {season_num: future.result() for season_num, future in futures.items()}
+
     seasons_data = []
-    for season_num in season_nums:
-        print(f"Fetching Season {season_num}...")
-        episodes = get_episode_ratings(imdb_id, season_num)
+    for season_num in sorted(episodes_by_season):
+        episodes = episodes_by_season[season_num]
         seasons_data.append({
             "season_num": season_num,
             "episodes": episodes,
         })
-        print(f"  Found {len(episodes)} episode(s)")
+        print(f"  Season {season_num}: {len(episodes)} episode(s)")
 
     # Calculate analytics
     print("Calculating analytics...")
     analytics = calculate_analytics(seasons_data)
 
+    # Precompute heatmap colors in one batch rather than per template cell
+    _assign_rating_colors([ep for season in seasons_data for ep in season["episodes"]], "rating")
+    _assign_rating_colors(analytics["season_averages"], "average")
+
     # Find max episodes in any season (for grid layout)
     max_episodes = max(len(s["episodes"]) for s in seasons_data) if seasons_data else 0
 
@@ -358,24 +540,29 @@ def scrape_show(url: str) -> dict:
     }
 
 
-def generate_html(data: dict, output_path: Path) -> None:
-    """Generate HTML file from scraped data."""
-    env = Environment(loader=FileSystemLoader(TEMPLATES_DIR))
+@functools.lru_cache(maxsize=1)
+def _template_env() -> Environment:
+    """Build the Jinja environment once so each template is compiled only once."""
+    env = Environment(loader=FileSystemLoader(TEMPLATES_DIR), auto_reload=False, cache_size=50)
     env.globals["get_rating_color"] = get_rating_color
+    return env
+
 
-    template = env.get_template("ratings.html")
+def generate_html(data: dict, output_path: Path) -> None:
+    """Generate HTML file from scraped data."""
+    template = _template_env().get_template("ratings.html")
     html = template.render(show=data)
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(html)
+    output_path.write_bytes(html.encode("utf-8"))
     print(f"Generated: {output_path}")
 
 
 def slugify(text: str) -> str:
     """Convert text to URL-friendly slug."""
     text = text.lower()
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[-\s]+', '-', text)
+    text = _RE_SLUG_NONWORD.sub('', text)
+    text = _RE_SLUG_DASH.sub('-', text)
     return text.strip('-')
 
 
@@ -391,11 +578,18 @@ def main():
         "--output", "-o",
         help="Output filename (default: {show-name}.html)"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk HTTP cache and fetch fresh pages from IMDB"
+    )
 
     args = parser.parse_args()
 
     # Scrape the show
-    data = scrape_show(args.url)
+    bypass_cache = args.no_cache and requests_cache is not None
+    with _session().cache_disabled() if bypass_cache else nullcontext():
+        data = scrape_show(args.url)
 
     # Determine output path
     if args.output: